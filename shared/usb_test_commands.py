@@ -17,9 +17,11 @@ def do_usb_command(cmd, args):
     # - commands must be upper case
 
     if cmd == 'XKEY':
+        # one or more keys, queued in order as if pressed back-to-back
         from glob import numpad
         try:
-            numpad.inject(str(args, 'ascii'))
+            for k in str(args, 'ascii'):
+                numpad.inject(k)
         except: pass
         return
 
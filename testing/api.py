@@ -2,10 +2,32 @@
 #
 # needs local bitcoind in PATH
 
-import os, time, uuid, socket, shutil, pytest, tempfile, subprocess, signal, base64
+import os, sys, time, uuid, socket, shutil, pytest, tempfile, subprocess, signal, base64
+import ctypes, select, functools
+from concurrent.futures import ThreadPoolExecutor
 from authproxy import AuthServiceProxy, JSONRPCException
 
+# from <sys/inotify.h>
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
 
+# tmpfs if we have a roomy one, else tempfile's default
+# - bitcoind wants >50MiB free at start, plus 16MiB blk*.dat preallocation;
+#   docker gives /dev/shm only 64MB by default
+RAM_TMPDIR_MIN_FREE = 256 * 1024 * 1024
+
+def ram_tmpdir(path='/dev/shm'):
+    try:
+        if shutil.disk_usage(path).free >= RAM_TMPDIR_MIN_FREE:
+            return path
+    except OSError:
+        pass
+    return None
+
+RAM_TMPDIR = ram_tmpdir()
+
+
+@functools.lru_cache(maxsize=1)
 def find_bitcoind():
     # search for the binary we need
     # - should be in the path really
@@ -21,29 +43,92 @@ def find_bitcoind():
     raise RuntimeError("Need a binary for bitcoin core. Check path?")
 
 
+def inotify_watch(dirname):
+    # Linux only: fd that becomes readable when a file appears in dirname, or None
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(dirname), IN_CREATE | IN_MOVED_TO) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def wait_for_file(path, timeout=10):
+    # block until path exists; event driven where possible, else poll
+    deadline = time.time() + timeout
+    fd = inotify_watch(os.path.dirname(path))
+    try:
+        while not os.path.exists(path):
+            remain = deadline - time.time()
+            if remain <= 0:
+                raise RuntimeError(f"'{os.path.basename(path)}' not found. Is bitcoind running?")
+            if fd is None:
+                time.sleep(min(0.05, remain))
+            elif select.select([fd], [], [], remain)[0]:
+                os.read(fd, 4096)       # drain events, then re-check
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+
+def wait_for_port(port, timeout=10):
+    # plain TCP probe w/ exponential backoff, cheaper than failing full RPC calls
+    deadline = time.time() + timeout
+    delay = 0.02
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            if time.time() >= deadline:
+                raise RuntimeError(f"Nothing listening on port {port}. Is bitcoind running?")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+
+def sigterm_unwind(signum, frame):
+    raise KeyboardInterrupt("SIGTERM")
+
+
 # stolen from HWI test suite and slightly modified
 class Bitcoind:
     def __init__(self):
         self.bitcoind_path = find_bitcoind()
-        self.datadir = tempfile.mkdtemp()
+        # tmpfs: all of bitcoind's fsync-ing becomes cheap
+        self.datadir = tempfile.mkdtemp(dir=RAM_TMPDIR)
         self.rpc = None
         self.bitcoind_proc = None
         self.userpass = None
         self.supply_wallet = None
+        # AuthServiceProxy per wallet name; each holds its own keep-alive connection
+        self.wallet_rpcs = {}
 
     def start(self):
 
-        def get_free_port():
+        def reserve_port():
+            # bound socket holds the port until closed; closing it is left
+            # until just before bitcoind needs it, to keep the race window tiny
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.bind(("", 0))
-            s.listen(1)
-            port = s.getsockname()[1]
-            s.close()
-            return port
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(("127.0.0.1", 0))
+            return s
 
-        self.p2p_port = get_free_port()
-        self.rpc_port = get_free_port()
+        # both held at once, so kernel cannot hand us the same port twice
+        reserved = [reserve_port(), reserve_port()]
+        self.p2p_port, self.rpc_port = [s.getsockname()[1] for s in reserved]
 
+        # exists up front so we can watch it for the cookie file
+        os.makedirs(os.path.join(self.datadir, "regtest"), exist_ok=True)
+
+        for s in reserved:
+            s.close()
         self.bitcoind_proc = subprocess.Popen(
             [
                 self.bitcoind_path,
@@ -54,72 +139,108 @@ class Bitcoind:
                 "-server=1",
                 "-keypool=1",
                 f"-port={self.p2p_port}",
-                f"-rpcport={self.rpc_port}"
-            ]
+                f"-rpcport={self.rpc_port}",
+                # no P2P needed (or wanted) on regtest, keep it small & quick to start
+                "-listen=0",
+                "-dnsseed=0",
+                "-maxconnections=0",
+                "-dbcache=50",
+                "-maxmempool=5",
+            ],
+            # python's fds are non-inheritable anyway; without close_fds Popen
+            # can use posix_spawn (vfork) rather than fork+exec of our big process
+            close_fds=False,
         )
-        signal.signal(signal.SIGTERM, self.cleanup)
+        # don't clean up from inside the handler (could be mid-RPC), just unwind
+        # and let the fixture teardown call cleanup() from normal code
+        signal.signal(signal.SIGTERM, sigterm_unwind)
 
         # Wait for cookie file to be created
         cookie_path = os.path.join(self.datadir, "regtest", ".cookie")
-        for i in range(20):
-            if not os.path.exists(cookie_path):
-                time.sleep(0.5)
-        else:
-            RuntimeError("'.cookie' not found. Is bitcoind running?")
+        wait_for_file(cookie_path, timeout=10)
         # Read .cookie file to get user and pass
         with open(cookie_path) as f:
             self.userpass = f.readline().lstrip().rstrip()
         self.rpc_url = f"http://{self.userpass}@127.0.0.1:{self.rpc_port}"
         self.rpc = AuthServiceProxy(self.rpc_url)
 
-        # Wait for bitcoind to be ready
-        ready = False
-        while not ready:
+        # Wait for bitcoind to be ready: RPC socket first, then end of warmup
+        wait_for_port(self.rpc_port, timeout=10)
+        delay = 0.02
+        while True:
             try:
-                self.rpc.getblockchaininfo()
-                ready = True
+                chain_info, net_info = self.rpc.batch_([["getblockchaininfo"], ["getnetworkinfo"]])
+                break
             except JSONRPCException:
-                time.sleep(0.5)
-                pass
+                # -28: still loading
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
 
-        assert self.rpc.getblockchaininfo()['chain'] == 'regtest'
-        assert self.rpc.getnetworkinfo()['version'] >= 220000, "we require >= 22.0 of Core"
+        assert chain_info['chain'] == 'regtest'
+        assert net_info['version'] >= 220000, "we require >= 22.0 of Core"
         # not descriptors so that we can do dumpwallet
         self.supply_wallet = self.create_wallet(wallet_name="supply", descriptors=False)
         # Make sure there are blocks and coins available
         self.supply_wallet.generatetoaddress(101, self.supply_wallet.getnewaddress())
 
     def get_wallet_rpc(self, wallet):
-        url = self.rpc_url + f"/wallet/{wallet}"
-        return AuthServiceProxy(url)
+        # reuse proxy (and its HTTP connection) if we've talked to this wallet before
+        rv = self.wallet_rpcs.get(wallet)
+        if rv is None:
+            url = self.rpc_url + f"/wallet/{wallet}"
+            rv = self.wallet_rpcs[wallet] = AuthServiceProxy(url)
+        return rv
 
     def create_wallet(self, wallet_name: str, disable_private_keys: bool = False, blank: bool = False,
                       passphrase: str = None, avoid_reuse: bool = False, descriptors: bool = True,
-                      load_on_startup: bool = False, external_signer: bool = False) -> AuthServiceProxy:
+                      load_on_startup: bool = False, external_signer: bool = False,
+                      rpc: AuthServiceProxy = None) -> AuthServiceProxy:
         """Create wallet and return AuthServiceProxy object to that wallet"""
-        self.rpc.createwallet(wallet_name=wallet_name, disable_private_keys=disable_private_keys,
-                              blank=blank, passphrase=passphrase, avoid_reuse=avoid_reuse,
-                              descriptors=descriptors, load_on_startup=load_on_startup,
-                              external_signer=external_signer)
+        rpc = rpc or self.rpc
+        rpc.createwallet(wallet_name=wallet_name, disable_private_keys=disable_private_keys,
+                         blank=blank, passphrase=passphrase, avoid_reuse=avoid_reuse,
+                         descriptors=descriptors, load_on_startup=load_on_startup,
+                         external_signer=external_signer)
         return self.get_wallet_rpc(wallet_name)
 
+    def create_wallets_parallel(self, specs, max_workers=4):
+        """Create several wallets concurrently, specs being create_wallet() kwargs.
+        Returns AuthServiceProxy objects in the same order as specs."""
+        def one(spec):
+            # proxy objects are not thread-safe: own connection per call
+            rpc = AuthServiceProxy(self.rpc_url)
+            self.create_wallet(rpc=rpc, **spec)
+            return spec["wallet_name"]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            names = list(ex.map(one, specs))
+        return [self.get_wallet_rpc(name) for name in names]
+
     def cleanup(self, *args, **kwargs):
         if self.bitcoind_proc is not None and self.bitcoind_proc.poll() is None:
-            self.bitcoind_proc.kill()
-        time.sleep(0.5)
-        shutil.rmtree(self.datadir)
+            # graceful first, so wallets get flushed; returns as soon as it's reaped
+            self.bitcoind_proc.terminate()
+            try:
+                self.bitcoind_proc.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                self.bitcoind_proc.kill()
+                self.bitcoind_proc.wait()
+        shutil.rmtree(self.datadir, ignore_errors=True)
 
     def delete_wallet_files(self, pattern=None):
+        # pattern=None removes all
         wallets_dir = os.path.join(self.datadir, "regtest/wallets")
-        wallet_files = os.listdir(wallets_dir)
-        for wf in wallet_files:
-            abs_path = os.path.join(wallets_dir, wf)
-            if pattern is None:
-                # remove all
-                shutil.rmtree(abs_path)
-            else:
-                if pattern in wf:
-                    shutil.rmtree(abs_path)
+        with os.scandir(wallets_dir) as it:
+            targets = [e for e in it if pattern is None or pattern in e.name]
+        if not targets:
+            return
+
+        # unlink heavy, parallelizes well
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as ex:
+            list(ex.map(shutil.rmtree, [e.path for e in targets]))
+
+        for e in targets:
+            self.wallet_rpcs.pop(e.name, None)
 
     @staticmethod
     def create(*args, **kwargs):
@@ -134,7 +255,7 @@ def bitcoind():
     # this assumes that you have bitcoind in path somewhere
     bitcoin_d = Bitcoind.create()
     yield bitcoin_d
-    os.killpg(os.getpgid(bitcoin_d.bitcoind_proc.pid), signal.SIGTERM)
+    bitcoin_d.cleanup()
 
 
 @pytest.fixture
@@ -144,17 +265,19 @@ def match_key(bitcoind, set_master_key, reset_seed_words):
     # bummer: dumpmasterprivkey RPC call was removed!
     #prv = bitcoind.dumpmasterprivkey()
 
-    from tempfile import mktemp
-    fn = mktemp()
+    # keep the dump in RAM when we can; bitcoind refuses to overwrite, so just a fresh name
+    fn = os.path.join(tempfile.mkdtemp(dir=RAM_TMPDIR), 'dump.txt')
     bitcoind.supply_wallet.dumpwallet(fn)
     prv = None
 
-    for ln in open(fn, 'rt').readlines():
-        if 'extended private masterkey' in ln:
-            assert not prv
-            prv = ln.split(": ", 1)[1].strip()
-
-    os.unlink(fn)
+    try:
+        with open(fn, 'rt') as f:
+            for ln in f:
+                if 'extended private masterkey' in ln:
+                    prv = ln.split(": ", 1)[1].strip()
+                    break
+    finally:
+        shutil.rmtree(os.path.dirname(fn))
 
     assert prv.startswith('tprv')
 
@@ -211,67 +334,125 @@ def bitcoind_d_wallet_w_sk(bitcoind):
     yield conn
 
 
+# simulator's wallet (as descriptors), built once and shared by the fixtures below
+SIM_WATCH_DESCRIPTORS = (
+    {
+        "timestamp": "now",
+        "label": "Coldcard 0f056943 segwit v0",
+        "active": True,
+        "desc": "wpkh([0f056943/84h/1h/0h]tpubDC7jGaaSE66Pn4dgtbAAstde4bCyhSUs4r3P8WhMVvPByvcRrzrwqSvpF9Ghx83Z1LfVugGRrSBko5UEKELCz9HoMv5qKmGq3fqnnbS5E9r/0/*)#erexmnep",
+        "internal": False
+    },
+    {
+        "desc": "wpkh([0f056943/84h/1h/0h]tpubDC7jGaaSE66Pn4dgtbAAstde4bCyhSUs4r3P8WhMVvPByvcRrzrwqSvpF9Ghx83Z1LfVugGRrSBko5UEKELCz9HoMv5qKmGq3fqnnbS5E9r/1/*)#ghu8xxfe",
+        "active": True,
+        "internal": True,
+        "timestamp": "now"
+    },
+    {
+        "timestamp": "now",
+        "label": "Coldcard 0f056943 segwit v1",
+        "active": True,
+        "desc": "tr([0f056943/86h/1h/0h]tpubDCeEX49avtiXrBTv3JWTtco99Ka499jXdZHBRtm7va2gkMAui11ctZjqNAT9dLVNaEozt2C1kfTM88cnvZCXsWLJN2p4viGvsyGjtKVV7A1/0/*)#6ghw47ge",
+        "internal": False
+    },
+    {
+        "desc": "tr([0f056943/86h/1h/0h]tpubDCeEX49avtiXrBTv3JWTtco99Ka499jXdZHBRtm7va2gkMAui11ctZjqNAT9dLVNaEozt2C1kfTM88cnvZCXsWLJN2p4viGvsyGjtKVV7A1/1/*)#tuj0gtcp",
+        "active": True,
+        "internal": True,
+        "timestamp": "now"
+    },
+    {
+        "timestamp": "now",
+        "label": "Coldcard 0f056943 p2pkh",
+        "active": True,
+        "desc": "pkh([0f056943/44h/1h/0h]tpubDCiHGUNYdRRBPNYm7CqeeLwPWfeb2ZT2rPsk4aEW3eUoJM93jbBa7hPpB1T9YKtigmjpxHrB1522kSsTxGm9V6cqKqrp1EDaYaeJZqcirYB/0/*)#fxwk08tc",
+        "internal": False
+    },
+    {
+        "timestamp": "now",
+        "active": True,
+        "desc": "pkh([0f056943/44h/1h/0h]tpubDCiHGUNYdRRBPNYm7CqeeLwPWfeb2ZT2rPsk4aEW3eUoJM93jbBa7hPpB1T9YKtigmjpxHrB1522kSsTxGm9V6cqKqrp1EDaYaeJZqcirYB/1/*)#cjthjjmq",
+        "internal": True
+    },
+    {
+        "timestamp": "now",
+        "label": "Coldcard 0f056943 p2sh-p2wpkh",
+        "active": True,
+        "desc": "sh(wpkh([0f056943/49h/1h/0h]tpubDCDqt7XXvhAYY9HSwrCXB7BXqYM4RXB8WFtKgtTXGa6u3U6EV1NJJRFTcuTRyhSY5Vreg1LP8aPdyiAPQGrDJLikkHoc7VQg6DA9NtUxHtj/0/*))#weah3vek",
+        "internal": False
+    },
+    {
+        "timestamp": "now",
+        "active": True,
+        "desc": "sh(wpkh([0f056943/49h/1h/0h]tpubDCDqt7XXvhAYY9HSwrCXB7BXqYM4RXB8WFtKgtTXGa6u3U6EV1NJJRFTcuTRyhSY5Vreg1LP8aPdyiAPQGrDJLikkHoc7VQg6DA9NtUxHtj/1/*))#mcnpfnvf",
+        "internal": True
+    },
+)
+
+SIM_SIGN_DESCRIPTORS = (
+    {
+        "timestamp": "now",
+        "label": "Coldcard 0f056943",
+        "active": True,
+        "desc": "wpkh([0f056943/84h/1h/0h]tprv8fRh8AYC5iQitbbtzwVaUUyXVZh3Y7HxVYSbqzf45eao9SMfEc3MexJx4y6pU1WjjxcEiYArEjhRTSy5mqfXzBtSncTYhKfxQWywcfeqxFE/0/*)#mzg0pna0",
+        "internal": False
+    },
+    {
+        "timestamp": "now",
+        "active": True,
+        "desc": "wpkh([0f056943/84h/1h/0h]tprv8fRh8AYC5iQitbbtzwVaUUyXVZh3Y7HxVYSbqzf45eao9SMfEc3MexJx4y6pU1WjjxcEiYArEjhRTSy5mqfXzBtSncTYhKfxQWywcfeqxFE/1/*)#2kdwuxdh",
+        "internal": True
+    },
+    {
+        "timestamp": "now",
+        "label": "Coldcard 0f056943 segwit v1",
+        "active": True,
+        "desc": "tr([0f056943/86h/1h/0h]tprv8fxCNe7LnX2rxiS89eqsVD92aJ47ypYd4FgQ9NipWJEHurv95cC2i57yC2mRHnpuHfmgdb17GV9wfSNjswUQXmaY7Qs2Jaa5hEdkxaHy4BK/0/*)#x7dfk9mw",
+        "internal": False
+    },
+    {
+        "desc": "tr([0f056943/86h/1h/0h]tprv8fxCNe7LnX2rxiS89eqsVD92aJ47ypYd4FgQ9NipWJEHurv95cC2i57yC2mRHnpuHfmgdb17GV9wfSNjswUQXmaY7Qs2Jaa5hEdkxaHy4BK/1/*)#h2ggtstk",
+        "active": True,
+        "internal": True,
+        "timestamp": "now"
+    },
+    {
+        "timestamp": "now",
+        "label": "Coldcard 0f056943",
+        "active": True,
+        "desc": "pkh([0f056943/44h/1h/0h]tprv8g2F84LJV3jWVuWyDZB4EwHGwe8esEG8H6Gxn4CCdNgQTrtH7CMywCmwzuMGZjz13sQ9rcCZucCm6i2zigkYGSPUvCzDQxGW8RCy7FpPdrg/0/*)#kjnlnm3v",
+        "internal": False
+    },
+    {
+        "timestamp": "now",
+        "active": True,
+        "desc": "pkh([0f056943/44h/1h/0h]tprv8g2F84LJV3jWVuWyDZB4EwHGwe8esEG8H6Gxn4CCdNgQTrtH7CMywCmwzuMGZjz13sQ9rcCZucCm6i2zigkYGSPUvCzDQxGW8RCy7FpPdrg/1/*)#8xk7wwp5",
+        "internal": True
+    },
+    {
+        "timestamp": "now",
+        "label": "Coldcard 0f056943",
+        "active": True,
+        "desc": "sh(wpkh([0f056943/49h/1h/0h]tprv8fXojhVHnKUsegFf4CXvmhXRGWq8GBzDvxHYQNRDrJJWCyqTrcYi7vdbSn65CHETVPdw4sxc75v23Ev7o8fCePazRf917CMt1C3mjnKV4Jq/0/*))#0qf5gv2y",
+        "internal": False
+    },
+    {
+        "timestamp": "now",
+        "active": True,
+        "desc": "sh(wpkh([0f056943/49h/1h/0h]tprv8fXojhVHnKUsegFf4CXvmhXRGWq8GBzDvxHYQNRDrJJWCyqTrcYi7vdbSn65CHETVPdw4sxc75v23Ev7o8fCePazRf917CMt1C3mjnKV4Jq/1/*))#6p8zsnlm",
+        "internal": True
+    },
+)
+
+
 @pytest.fixture
 def bitcoind_d_sim_watch(bitcoind):
     # watch only descriptor wallet simulator
     w_name = 'ckcc-test-desc-wallet-sim-%s' % uuid.uuid4()
     conn = bitcoind.create_wallet(wallet_name=w_name, disable_private_keys=True, blank=True,
                                   passphrase=None, avoid_reuse=False, descriptors=True)
-    descriptors = [
-        {
-            "timestamp": "now",
-            "label": "Coldcard 0f056943 segwit v0",
-            "active": True,
-            "desc": "wpkh([0f056943/84h/1h/0h]tpubDC7jGaaSE66Pn4dgtbAAstde4bCyhSUs4r3P8WhMVvPByvcRrzrwqSvpF9Ghx83Z1LfVugGRrSBko5UEKELCz9HoMv5qKmGq3fqnnbS5E9r/0/*)#erexmnep",
-            "internal": False
-        },
-        {
-            "desc": "wpkh([0f056943/84h/1h/0h]tpubDC7jGaaSE66Pn4dgtbAAstde4bCyhSUs4r3P8WhMVvPByvcRrzrwqSvpF9Ghx83Z1LfVugGRrSBko5UEKELCz9HoMv5qKmGq3fqnnbS5E9r/1/*)#ghu8xxfe",
-            "active": True,
-            "internal": True,
-            "timestamp": "now"
-        },
-        {
-            "timestamp": "now",
-            "label": "Coldcard 0f056943 segwit v1",
-            "active": True,
-            "desc": "tr([0f056943/86h/1h/0h]tpubDCeEX49avtiXrBTv3JWTtco99Ka499jXdZHBRtm7va2gkMAui11ctZjqNAT9dLVNaEozt2C1kfTM88cnvZCXsWLJN2p4viGvsyGjtKVV7A1/0/*)#6ghw47ge",
-            "internal": False
-        },
-        {
-            "desc": "tr([0f056943/86h/1h/0h]tpubDCeEX49avtiXrBTv3JWTtco99Ka499jXdZHBRtm7va2gkMAui11ctZjqNAT9dLVNaEozt2C1kfTM88cnvZCXsWLJN2p4viGvsyGjtKVV7A1/1/*)#tuj0gtcp",
-            "active": True,
-            "internal": True,
-            "timestamp": "now"
-        },
-        {
-            "timestamp": "now",
-            "label": "Coldcard 0f056943 p2pkh",
-            "active": True,
-            "desc": "pkh([0f056943/44h/1h/0h]tpubDCiHGUNYdRRBPNYm7CqeeLwPWfeb2ZT2rPsk4aEW3eUoJM93jbBa7hPpB1T9YKtigmjpxHrB1522kSsTxGm9V6cqKqrp1EDaYaeJZqcirYB/0/*)#fxwk08tc",
-            "internal": False
-        },
-        {
-            "timestamp": "now",
-            "active": True,
-            "desc": "pkh([0f056943/44h/1h/0h]tpubDCiHGUNYdRRBPNYm7CqeeLwPWfeb2ZT2rPsk4aEW3eUoJM93jbBa7hPpB1T9YKtigmjpxHrB1522kSsTxGm9V6cqKqrp1EDaYaeJZqcirYB/1/*)#cjthjjmq",
-            "internal": True
-        },
-        {
-            "timestamp": "now",
-            "label": "Coldcard 0f056943 p2sh-p2wpkh",
-            "active": True,
-            "desc": "sh(wpkh([0f056943/49h/1h/0h]tpubDCDqt7XXvhAYY9HSwrCXB7BXqYM4RXB8WFtKgtTXGa6u3U6EV1NJJRFTcuTRyhSY5Vreg1LP8aPdyiAPQGrDJLikkHoc7VQg6DA9NtUxHtj/0/*))#weah3vek",
-            "internal": False
-        },
-        {
-            "timestamp": "now",
-            "active": True,
-            "desc": "sh(wpkh([0f056943/49h/1h/0h]tpubDCDqt7XXvhAYY9HSwrCXB7BXqYM4RXB8WFtKgtTXGa6u3U6EV1NJJRFTcuTRyhSY5Vreg1LP8aPdyiAPQGrDJLikkHoc7VQg6DA9NtUxHtj/1/*))#mcnpfnvf",
-            "internal": True
-        },
-    ]
-    conn.importdescriptors(descriptors)
+    conn.importdescriptors(SIM_WATCH_DESCRIPTORS)
     yield conn
 
 @pytest.fixture
@@ -280,62 +461,7 @@ def bitcoind_d_sim_sign(bitcoind):
     w_name = 'ckcc-test-desc-wallet-sim-%s' % uuid.uuid4()
     conn = bitcoind.create_wallet(wallet_name=w_name, disable_private_keys=False, blank=True,
                                   passphrase=None, avoid_reuse=False, descriptors=True)
-    # below is simulator descriptor wallet
-    descriptors = [
-        {
-            "timestamp": "now",
-            "label": "Coldcard 0f056943",
-            "active": True,
-            "desc": "wpkh([0f056943/84h/1h/0h]tprv8fRh8AYC5iQitbbtzwVaUUyXVZh3Y7HxVYSbqzf45eao9SMfEc3MexJx4y6pU1WjjxcEiYArEjhRTSy5mqfXzBtSncTYhKfxQWywcfeqxFE/0/*)#mzg0pna0",
-            "internal": False
-        },
-        {
-            "timestamp": "now",
-            "active": True,
-            "desc": "wpkh([0f056943/84h/1h/0h]tprv8fRh8AYC5iQitbbtzwVaUUyXVZh3Y7HxVYSbqzf45eao9SMfEc3MexJx4y6pU1WjjxcEiYArEjhRTSy5mqfXzBtSncTYhKfxQWywcfeqxFE/1/*)#2kdwuxdh",
-            "internal": True
-        },
-        {
-            "timestamp": "now",
-            "label": "Coldcard 0f056943 segwit v1",
-            "active": True,
-            "desc": "tr([0f056943/86h/1h/0h]tprv8fxCNe7LnX2rxiS89eqsVD92aJ47ypYd4FgQ9NipWJEHurv95cC2i57yC2mRHnpuHfmgdb17GV9wfSNjswUQXmaY7Qs2Jaa5hEdkxaHy4BK/0/*)#x7dfk9mw",
-            "internal": False
-        },
-        {
-            "desc": "tr([0f056943/86h/1h/0h]tprv8fxCNe7LnX2rxiS89eqsVD92aJ47ypYd4FgQ9NipWJEHurv95cC2i57yC2mRHnpuHfmgdb17GV9wfSNjswUQXmaY7Qs2Jaa5hEdkxaHy4BK/1/*)#h2ggtstk",
-            "active": True,
-            "internal": True,
-            "timestamp": "now"
-        },
-        {
-            "timestamp": "now",
-            "label": "Coldcard 0f056943",
-            "active": True,
-            "desc": "pkh([0f056943/44h/1h/0h]tprv8g2F84LJV3jWVuWyDZB4EwHGwe8esEG8H6Gxn4CCdNgQTrtH7CMywCmwzuMGZjz13sQ9rcCZucCm6i2zigkYGSPUvCzDQxGW8RCy7FpPdrg/0/*)#kjnlnm3v",
-            "internal": False
-        },
-        {
-            "timestamp": "now",
-            "active": True,
-            "desc": "pkh([0f056943/44h/1h/0h]tprv8g2F84LJV3jWVuWyDZB4EwHGwe8esEG8H6Gxn4CCdNgQTrtH7CMywCmwzuMGZjz13sQ9rcCZucCm6i2zigkYGSPUvCzDQxGW8RCy7FpPdrg/1/*)#8xk7wwp5",
-            "internal": True
-        },
-        {
-            "timestamp": "now",
-            "label": "Coldcard 0f056943",
-            "active": True,
-            "desc": "sh(wpkh([0f056943/49h/1h/0h]tprv8fXojhVHnKUsegFf4CXvmhXRGWq8GBzDvxHYQNRDrJJWCyqTrcYi7vdbSn65CHETVPdw4sxc75v23Ev7o8fCePazRf917CMt1C3mjnKV4Jq/0/*))#0qf5gv2y",
-            "internal": False
-        },
-        {
-            "timestamp": "now",
-            "active": True,
-            "desc": "sh(wpkh([0f056943/49h/1h/0h]tprv8fXojhVHnKUsegFf4CXvmhXRGWq8GBzDvxHYQNRDrJJWCyqTrcYi7vdbSn65CHETVPdw4sxc75v23Ev7o8fCePazRf917CMt1C3mjnKV4Jq/1/*))#6p8zsnlm",
-            "internal": True
-        },
-    ]
-    conn.importdescriptors(descriptors)
+    conn.importdescriptors(SIM_SIGN_DESCRIPTORS)
     yield conn
 
 # EOF
@@ -85,9 +85,13 @@ class AuthServiceProxy():
         if name.startswith('__') and name.endswith('__'):
             # Python internal stuff
             raise AttributeError
+        attr = name
         if self._service_name is not None:
             name = "%s.%s" % (self._service_name, name)
-        return AuthServiceProxy(self.__service_url, name, connection=self.__conn)
+        rv = AuthServiceProxy(self.__service_url, name, connection=self.__conn)
+        # remember it: saves re-parsing URL and auth header on every RPC call
+        self.__dict__[attr] = rv
+        return rv
 
     def _request(self, method, path, postdata):
         '''
@@ -97,7 +101,8 @@ class AuthServiceProxy():
         headers = {'Host': self.__url.hostname,
                    'User-Agent': USER_AGENT,
                    'Authorization': self.__auth_header,
-                   'Content-type': 'application/json'}
+                   'Content-type': 'application/json',
+                   'Connection': 'keep-alive'}
         if os.name == 'nt':
             # Windows somehow does not like to re-use connections
             # TODO: Find out why the connection would disconnect occasionally and make it reusable on Windows
@@ -157,6 +162,24 @@ class AuthServiceProxy():
                 'code': -342, 'message': 'non-200 HTTP status code but no JSON-RPC error'}, status)
         return response
 
+    def batch_(self, calls):
+        '''
+        Send [[method, *params], ...] as one JSON-RPC batch and return the results
+        in the same order, raising on the first error.
+        '''
+        requests = [getattr(self, method).get_request(*params) for method, *params in calls]
+        by_id = {r['id']: r for r in self.batch(requests)}
+        rv = []
+        for req in requests:
+            resp = by_id.get(req['id'])
+            if resp is None:
+                raise JSONRPCException({
+                    'code': -343, 'message': 'missing JSON-RPC result'})
+            if resp['error'] is not None:
+                raise JSONRPCException(resp['error'])
+            rv.append(resp['result'])
+        return rv
+
     def _get_response(self):
         req_start_time = time.time()
         try:
@@ -1,9 +1,9 @@
 # (c) Copyright 2020 by Coinkite Inc. This file is covered by license found in COPYING-CC.
 #
-import pytest, time, sys, random, re, ndef, os, glob, hashlib, json
+import pytest, time, sys, random, re, ndef, os, glob, hashlib, json, functools
 from subprocess import check_output
 from ckcc.protocol import CCProtocolPacker
-from helpers import B2A, U2SAT
+from helpers import B2A, U2SAT, wait_until
 from msg import verify_message
 from api import bitcoind, match_key
 from api import bitcoind_wallet, bitcoind_d_wallet, bitcoind_d_wallet_w_sk, bitcoind_d_sim_sign
@@ -40,6 +40,14 @@ def pytest_addoption(parser):
     # to make bitcoind produce psbt v2 one currently needs https://github.com/achow101/bitcoin/tree/psbt2
     # or wait until https://github.com/bitcoin/bitcoin/pull/21283 merged and released
 
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # keep each phase's report on the item (rep_setup, rep_call, rep_teardown)
+    # so fixtures can see during their teardown whether the test passed
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, "rep_" + rep.when, rep)
+
 @pytest.fixture(scope='session')
 def dev(request):
     # a connected Coldcard (via USB) .. or the simulator
@@ -156,6 +164,22 @@ def need_keypress(dev, request):
 
     return doit
 
+@pytest.fixture(scope='module')
+def need_keypresses(dev, request, need_keypress):
+    # several keys, back-to-back, in a single USB round-trip
+    # - only for sequences that were already sent without pauses in between
+    # - each key takes two slots (press+release) in numpad's Queue(64), and
+    #   XKEY silently drops whatever doesn't fit, so keep sequences short
+    def doit(keys, timeout=1000):
+        assert len(keys) < 64 // 2, "too many keys for one XKEY: %d" % len(keys)
+        if request.config.getoption("--manual"):
+            for k in keys:
+                need_keypress(k, timeout=timeout)
+        else:
+            dev.send_recv(CCProtocolPacker.sim_keypress(keys.encode('ascii')), timeout=timeout)
+
+    return doit
+
 @pytest.fixture(scope='module')
 def enter_number(need_keypress):
     def doit(number):
@@ -393,6 +417,40 @@ def cap_story(sim_exec):
 
     return doit
 
+@pytest.fixture(scope='module')
+def cap_story_until(cap_story):
+    # wait for a story containing `text` to be shown; returns (title, body) like cap_story
+    def doit(text, timeout=2.0):
+        rv = None
+        def shown():
+            nonlocal rv
+            rv = cap_story()
+            return text in rv[1]
+        wait_until(shown, timeout=timeout)
+        return rv
+
+    return doit
+
+@pytest.fixture(scope='module')
+def cap_menu_until(cap_menu):
+    # wait until predicate(menu) holds; returns the menu (checked by caller)
+    def doit(predicate, timeout=2.0):
+        rv, err = None, None
+        def ready():
+            nonlocal rv, err
+            try:
+                rv = cap_menu()
+            except RuntimeError as exc:
+                err = exc
+                return False        # top of ux stack is not a menu (yet)
+            return predicate(rv)
+        wait_until(ready, timeout=timeout)
+        if rv is None:
+            raise err               # never saw a menu at all
+        return rv
+
+    return doit
+
 @pytest.fixture(scope='module')
 def cap_image(sim_exec):
 
@@ -1639,10 +1697,11 @@ def load_export(need_keypress, cap_story, microsd_path, virtdisk_path, nfc_read_
     return doit
 
 
-@pytest.fixture
-def tapsigner_encrypted_backup(microsd_path, virtdisk_path):
-    def doit(way, testnet=True):
-        # create backup
+@pytest.fixture(scope='session')
+def tapsigner_backup_maker():
+    # building a backup (new node + AES) is slow, so one per network for whole session
+    @functools.lru_cache(maxsize=None)
+    def doit(testnet):
         from pycoin.key.BIP32Node import BIP32Node
         node = BIP32Node.from_master_secret(os.urandom(32), netcode="XTN" if testnet else "BTC")
         plaintext = node.hwif(as_private=True) + '\n' + random.choice(["m", "m/84h/0h/0h", "m/44'/0'/0'/0'"])
@@ -1651,11 +1710,19 @@ def tapsigner_encrypted_backup(microsd_path, virtdisk_path):
         else:
             assert "xprv" in plaintext
         from bsms.encryption import aes_256_ctr_encrypt
-        from base64 import b64encode
         backup_key = os.urandom(16)  # 128 bit
-        backup_key_hex = backup_key.hex()
         ciphertext_hex = aes_256_ctr_encrypt(backup_key, bytes(16), plaintext)
-        ciphertext = bytes.fromhex(ciphertext_hex)
+        return node, backup_key.hex(), bytes.fromhex(ciphertext_hex)
+    return doit
+
+
+@pytest.fixture
+def tapsigner_encrypted_backup(microsd_path, virtdisk_path, tapsigner_backup_maker):
+    def doit(way, testnet=True, cached=False):
+        # create backup, or with cached=True reuse one made earlier; file is always re-written
+        from base64 import b64encode
+        make = tapsigner_backup_maker if cached else tapsigner_backup_maker.__wrapped__
+        node, backup_key_hex, ciphertext = make(testnet)
         ciphertext_b64 = b64encode(ciphertext).decode()
         fname = "backup-A4MQA-3135-02-15T0113.aes"
         if way == "sd":
@@ -1763,7 +1830,7 @@ from test_multisig import (import_ms_wallet, make_multisig, offer_ms_import, fak
                                 make_ms_address, clear_ms, make_myself_wallet)
 from test_bip39pw import set_bip39_pw
 from test_ephemeral import generate_ephemeral_words, import_ephemeral_xprv, goto_eph_seed_menu
-from test_ephemeral import ephemeral_seed_disabled_ui
+from test_ephemeral import ephemeral_seed_disabled_ui, random_xprv_node, random_bytes
 from test_ux import enter_complex, pass_word_quiz, word_menu_entry
 from test_se2 import goto_trick_menu, clear_all_tricks, new_trick_pin, se2_gate, new_pin_confirmed
 
@@ -1,7 +1,7 @@
 # (c) Copyright 2020 by Coinkite Inc. This file is covered by license found in COPYING-CC.
 #
 # stuff I need sometimes
-import random
+import random, time
 from io import BytesIO
 from binascii import b2a_hex, a2b_hex
 from decimal import Decimal
@@ -258,4 +258,14 @@ def detruncate_address(s):
     start, end = s.split('⋯')
     return start, end
 
+def wait_until(predicate, timeout=1.0, interval=0.01):
+    # poll, instead of a blind sleep, until predicate() is truthy
+    # - returns last value of predicate, so caller can assert on it
+    deadline = time.time() + timeout
+    while True:
+        rv = predicate()
+        if rv or time.time() >= deadline:
+            return rv
+        time.sleep(interval)
+
 # EOF
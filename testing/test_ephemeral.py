@@ -2,36 +2,86 @@
 #
 # Ephemeral Seeds tests
 #
-import pytest, time, re, os, shutil
-from constants import simulator_fixed_xpub
+import pytest, time, os, re, shutil, itertools
+from pathlib import Path
+from pycoin.key.BIP32Node import BIP32Node
+from constants import simulator_fixed_xpub, simulator_fixed_words
 from ckcc.protocol import CCProtocolPacker
 from txn import fake_txn
 from test_ux import word_menu_entry
 
 
+# num_words -> (phrase, phrase pre-split into words, xfp)
 WORDLISTS = {
-    12: ('abandon ' * 11 + 'about', '73C5DA0A'),
-    18: ('abandon ' * 17 + 'agent', 'E08B8AC3'),
-    24: ('abandon ' * 23 + 'art', '5436D724'),
+    n: (phrase, tuple(phrase.split()), xfp)
+    for n, phrase, xfp in [
+        (12, 'abandon ' * 11 + 'about', '73C5DA0A'),
+        (18, 'abandon ' * 17 + 'agent', 'E08B8AC3'),
+        (24, 'abandon ' * 23 + 'art', '5436D724'),
+    ]
 }
 
 
 def truncate_seed_words(words):
+    # callers should pass a list/tuple of words; string is split as a fallback
     if isinstance(words, str):
-        words = words.split(" ")
-    return ' '.join(w[0:4] for w in words)
+        words = words.split()
+    return ' '.join([w[:4] for w in words])
+
+
+def is_seed_word_line(line):
+    # lines are formatted '%2d: word' --> " 1: abandon" or "12: about"
+    s = line.lstrip()
+    return len(s) >= 3 and s[0].isdigit() and (s[1] == ':' or (s[1].isdigit() and s[2] == ':'))
 
 
 def seed_story_to_words(story: str):
     # filter those that starts with space, number and colon --> actual words
     words = [
-        line.strip().split(":")[1].strip()
-        for line in story.split("\n")
-        if re.search(r"\s\d:", line) or re.search(r"\d{2}:", line)
+        line.strip().split(":", 1)[1].strip()
+        for line in story.splitlines()
+        if is_seed_word_line(line)
     ]
     return words
 
 
+# all parts of the "Restore Seed" confirmation story, in order
+RESTORE_STORY_RE = re.compile(
+    r"Restore main wallet and its settings\?\n\n.*?"
+    r"Press OK to forget current ephemeral wallet .*?"
+    r"settings, or press \(1\) to save & keep .*?"
+    r"those settings for later use\.", re.S)
+
+
+@pytest.fixture(scope="session")
+def random_bytes():
+    # slices of one big os.urandom() block, rather than a syscall per call
+    # - unpredictable to the firmware, which is all tests need
+    buf = memoryview(b'')
+    def doit(n):
+        nonlocal buf
+        if n > len(buf):
+            buf = memoryview(os.urandom(max(n, 65536)))
+        rv, buf = bytes(buf[:n]), buf[n:]
+        return rv
+    return doit
+
+
+@pytest.fixture(scope="session")
+def random_xprv_node(random_bytes):
+    # few random master nodes per network, made on first use and handed out
+    # round-robin, so back-to-back callers still get different keys
+    pools = {}
+    def doit(testnet=True):
+        netcode = "XTN" if testnet else "BTC"
+        pool, seq = pools.setdefault(netcode, ([], itertools.count()))
+        i = next(seq) % 8
+        if i == len(pool):
+            pool.append(BIP32Node.from_master_secret(random_bytes(32), netcode=netcode))
+        return pool[i]
+    return doit
+
+
 @pytest.fixture
 def ephemeral_seed_disabled(sim_exec):
     def doit():
@@ -52,21 +102,21 @@ def ephemeral_seed_disabled_ui(cap_menu):
 
 
 @pytest.fixture
-def get_seed_value_ux(goto_home, pick_menu_item, need_keypress, cap_story, nfc_read_text):
+def get_seed_value_ux(goto_home, pick_menu_item, need_keypress, cap_story_until,
+                      nfc_read_text):
     def doit(nfc=False):
         goto_home()
         pick_menu_item("Advanced/Tools")
         pick_menu_item("Danger Zone")
         pick_menu_item("Seed Functions")
         pick_menu_item('View Seed Words')
-        time.sleep(.01)
-        title, body = cap_story()
+        title, body = cap_story_until('Are you SURE')
         assert 'Are you SURE' in body
         assert 'can control all funds' in body
         need_keypress('y')  # skip warning
-        time.sleep(0.01)
-        title, story = cap_story()
+        title, story = cap_story_until("Seed words (")
         if nfc:
+            # QR view and NFC animation aren't stories; nothing to poll for
             need_keypress("1")  # show QR code
             time.sleep(.1)
             need_keypress("3")  # any QR can be exported via NFC
@@ -81,20 +131,29 @@ def get_seed_value_ux(goto_home, pick_menu_item, need_keypress, cap_story, nfc_r
 
 
 @pytest.fixture
-def get_identity_story(goto_home, pick_menu_item, cap_story):
+def get_identity_story(goto_home, pick_menu_item, cap_story_until):
     def doit():
         goto_home()
         pick_menu_item("Advanced/Tools")
         pick_menu_item("View Identity")
-        time.sleep(0.1)
-        title, story = cap_story()
+        title, story = cap_story_until("Master Key Fingerprint:")
         return story
     return doit
 
 
 @pytest.fixture
-def goto_eph_seed_menu(goto_home, pick_menu_item, cap_story, need_keypress):
-    def _doit():
+def goto_eph_seed_menu(goto_home, pick_menu_item, cap_story, cap_menu, need_keypress):
+    def doit():
+        try:
+            menu = cap_menu()
+        except RuntimeError:
+            menu = []       # top of stack is not a menu
+        if "Generate Words" in menu and "Import XPRV" in menu:
+            # stories are drawn over the menu without touching the ux stack
+            title, story = cap_story()
+            if not title and not story:
+                return      # already there
+
         goto_home()
         pick_menu_item("Advanced/Tools")
         pick_menu_item("Ephemeral Seed")
@@ -105,38 +164,54 @@ def goto_eph_seed_menu(goto_home, pick_menu_item, cap_story, need_keypress):
             assert "Press (4) to prove you read to the end of this message and accept all consequences." in story
             need_keypress("4")  # understand consequences
 
+    return doit
+
+
+# master xpub left in effect by restore_main_seed, cleared by next reset_seed_words
+_CURRENT_XPUB = None
+
+
+@pytest.fixture(autouse=True)
+def forget_restored_seed(request):
+    # device state is unknown after a failed test; next reset must be a full one
+    yield
+    rep = getattr(request.node, "rep_call", None)
+    if rep is None or not rep.passed:
+        global _CURRENT_XPUB
+        _CURRENT_XPUB = None
+
+
+@pytest.fixture
+def reset_seed_words(reset_seed_words, goto_home):
+    # skip reloading the fixed seed if previous test already restored it
     def doit():
-        try:
-            _doit()
-        except:
-            time.sleep(.1)
-            _doit()
+        global _CURRENT_XPUB
+        restored, _CURRENT_XPUB = _CURRENT_XPUB, None
+        if restored == simulator_fixed_xpub:
+            goto_home()
+            return simulator_fixed_words
+        return reset_seed_words()
 
     return doit
 
 
 @pytest.fixture
-def restore_main_seed(goto_home, pick_menu_item, cap_story, cap_menu,
-                      need_keypress, settings_path):
-    def list_settings_files():
-        return [fn
-                for fn in os.listdir(settings_path(""))
-                if fn.endswith(".aes")]
+def restore_main_seed(goto_home, pick_menu_item, cap_story_until, cap_menu,
+                      cap_menu_until, need_keypress, settings_path, dev):
+    def count_settings_files():
+        with os.scandir(settings_path("")) as it:
+            return sum(1 for e in it if e.name.endswith(".aes"))
 
     def doit(preserve_settings=False):
-        prev = len(list_settings_files())
+        prev = count_settings_files()
         goto_home()
         menu = cap_menu()
         assert menu[-1] == "Restore Seed"
         assert (menu[0][0] == "[") and (menu[0][-1] == "]")
         pick_menu_item("Restore Seed")
-        time.sleep(.1)
-        title, story = cap_story()
+        title, story = cap_story_until("Restore main wallet and its settings?")
 
-        assert "Restore main wallet and its settings?\n\n" in story
-        assert "Press OK to forget current ephemeral wallet " in story
-        assert "settings, or press (1) to save & keep " in story
-        assert "those settings for later use." in story
+        assert RESTORE_STORY_RE.search(story)
 
         if preserve_settings:
             ch = "1"
@@ -144,29 +219,37 @@ def restore_main_seed(goto_home, pick_menu_item, cap_story, cap_menu,
             ch = "y"
 
         need_keypress(ch)
-        time.sleep(.3)
 
-        menu = cap_menu()
+        menu = cap_menu_until(lambda m: m[-1] != "Restore Seed")
         assert menu[-1] != "Restore Seed"
         assert (menu[0][0] != "[") and (menu[0][-1] != "]")
 
-        after = len(list_settings_files())
+        after = count_settings_files()
         if preserve_settings:
             assert prev == after, "p%d == a%d" % (prev, after)
         else:
             assert prev > after, "p%d > a%d" % (prev, after)
 
+        global _CURRENT_XPUB
+        _CURRENT_XPUB = dev.send_recv(CCProtocolPacker.get_xpub(), timeout=5000)
+
     return doit
 
 
+@pytest.fixture(scope="session")
+def ephemeral_psbts():
+    # master_xpub -> fake_txn() PSBT; same args every call, so only xpub varies
+    return {}
+
+
 @pytest.fixture
-def verify_ephemeral_secret_ui(cap_story, need_keypress, cap_menu, dev, fake_txn,
+def verify_ephemeral_secret_ui(cap_story_until, need_keypress, cap_menu, cap_menu_until,
+                               dev, fake_txn, ephemeral_psbts,
                                goto_eph_seed_menu, get_identity_story, try_sign,
                                get_seed_value_ux, pick_menu_item, goto_home,
                                restore_main_seed):
     def doit(mnemonic=None, xpub=None, expected_xfp=None, preserve_settings=False):
-        time.sleep(0.3)
-        title, story = cap_story()
+        title, story = cap_story_until("key in effect until next power down.")
         in_effect_xfp = title[1:-1]
         if expected_xfp is not None:
             assert in_effect_xfp == expected_xfp
@@ -193,13 +276,15 @@ def verify_ephemeral_secret_ui(cap_story, need_keypress, cap_menu, dev, fake_txn
         assert e_master_xpub != simulator_fixed_xpub
         if xpub:
             assert e_master_xpub == xpub
-        psbt = fake_txn(2, 2, master_xpub=e_master_xpub, segwit_in=True)
+        psbt = ephemeral_psbts.get(e_master_xpub)
+        if psbt is None:
+            psbt = fake_txn(2, 2, master_xpub=e_master_xpub, segwit_in=True)
+            ephemeral_psbts[e_master_xpub] = psbt
         try_sign(psbt, accept=True, finalize=True)  # MUST NOT raise
         need_keypress("y")
 
         goto_eph_seed_menu()
-        time.sleep(0.1)
-        menu = cap_menu()
+        menu = cap_menu_until(lambda m: m[0] == f"[{ident_xfp}]")
         # ephemeral seed chosen -> [xfp] will be visible
         assert menu[0] == f"[{ident_xfp}]"
 
@@ -215,7 +300,7 @@ def verify_ephemeral_secret_ui(cap_story, need_keypress, cap_menu, dev, fake_txn
 
 @pytest.fixture
 def generate_ephemeral_words(goto_eph_seed_menu, pick_menu_item,
-                             need_keypress, cap_story,
+                             need_keypress, need_keypresses, cap_story_until,
                              ephemeral_seed_disabled_ui):
     def doit(num_words, dice=False, from_main=False):
         goto_eph_seed_menu()
@@ -225,14 +310,11 @@ def generate_ephemeral_words(goto_eph_seed_menu, pick_menu_item,
         pick_menu_item("Generate Words")
         if not dice:
             pick_menu_item(f"{num_words} Words")
-            time.sleep(0.1)
         else:
             pick_menu_item(f"{num_words} Word Dice Roll")
-            for ch in '123456yy':
-                need_keypress(ch)
+            need_keypresses('123456yy')
 
-        time.sleep(0.2)
-        title, story = cap_story()
+        title, story = cap_story_until(f"Record these {num_words} secret words!")
         assert f"Record these {num_words} secret words!" in story
         assert "Press (6) to skip word quiz" in story
 
@@ -251,21 +333,19 @@ def generate_ephemeral_words(goto_eph_seed_menu, pick_menu_item,
 
 @pytest.fixture
 def import_ephemeral_xprv(microsd_path, virtdisk_path, goto_eph_seed_menu,
-                          pick_menu_item, need_keypress, cap_story,
-                          nfc_write_text, ephemeral_seed_disabled_ui):
+                          pick_menu_item, need_keypress, cap_story, cap_story_until,
+                          nfc_write_text, ephemeral_seed_disabled_ui, random_xprv_node):
     def doit(way, extended_key=None, testnet=True, from_main=False):
-        from pycoin.key.BIP32Node import BIP32Node
         fname = "ek.txt"
         if extended_key is None:
-            node = BIP32Node.from_master_secret(os.urandom(32), netcode="XTN" if testnet else "BTC")
+            node = random_xprv_node(testnet)
             ek = node.hwif(as_private=True) + '\n'
             if way == "sd":
                 fpath = microsd_path(fname)
             elif way == "vdisk":
                 fpath = virtdisk_path(fname)
             if way != "nfc":
-                with open(fpath, "w") as f:
-                    f.write(ek)
+                Path(fpath).write_text(ek)
         else:
             node = BIP32Node.from_wallet_key(extended_key)
             assert extended_key == node.hwif(as_private=True)
@@ -293,7 +373,6 @@ def import_ephemeral_xprv(microsd_path, virtdisk_path, goto_eph_seed_menu,
                 need_keypress("3")
                 time.sleep(0.2)
                 nfc_write_text(ek)
-                time.sleep(0.3)
         else:
             # virtual disk
             if "press (2) to import from Virtual Disk" not in story:
@@ -302,8 +381,7 @@ def import_ephemeral_xprv(microsd_path, virtdisk_path, goto_eph_seed_menu,
                 need_keypress("2")
 
         if way != "nfc":
-            time.sleep(0.1)
-            _, story = cap_story()
+            _, story = cap_story_until("Select file containing the extended private key")
             assert "Select file containing the extended private key" in story
             need_keypress("y")
             pick_menu_item(fname)
@@ -330,18 +408,18 @@ def test_ephemeral_seed_generate(num_words, generate_ephemeral_words, dice,
 
 
 @pytest.mark.parametrize("num_words", [12, 18, 24])
-@pytest.mark.parametrize("nfc", [False, True])
-@pytest.mark.parametrize("truncated", [False, True])
+@pytest.mark.parametrize("nfc,truncated", [
+    (False, False),
+    (True, False),
+    (True, True),       # truncated words only make sense via NFC
+])
 @pytest.mark.parametrize("preserve_settings", [False, True])
 def test_ephemeral_seed_import_words(nfc, truncated, num_words, cap_menu, pick_menu_item,
                                      need_keypress, reset_seed_words, goto_eph_seed_menu,
                                      word_menu_entry, nfc_write_text, verify_ephemeral_secret_ui,
                                      ephemeral_seed_disabled, get_seed_value_ux,
                                      preserve_settings):
-    if truncated and not nfc: return
-
-
-    words, expect_xfp = WORDLISTS[num_words]
+    words, word_list, expect_xfp = WORDLISTS[num_words]
 
     reset_seed_words()
     goto_eph_seed_menu()
@@ -353,7 +431,7 @@ def test_ephemeral_seed_import_words(nfc, truncated, num_words, cap_menu, pick_m
         pick_menu_item(f"{num_words} Words")
         time.sleep(0.1)
 
-        word_menu_entry(words.split())
+        word_menu_entry(word_list)
     else:
         menu = cap_menu()
         if 'Import via NFC' not in menu:
@@ -361,32 +439,32 @@ def test_ephemeral_seed_import_words(nfc, truncated, num_words, cap_menu, pick_m
         pick_menu_item('Import via NFC')
 
         if truncated:
-            truncated_words = truncate_seed_words(words)
+            truncated_words = truncate_seed_words(word_list)
             nfc_write_text(truncated_words)
         else:
             nfc_write_text(words)
 
     need_keypress("4")  # understand consequences
 
-    verify_ephemeral_secret_ui(mnemonic=words.split(" "), expected_xfp=expect_xfp,
+    verify_ephemeral_secret_ui(mnemonic=list(word_list), expected_xfp=expect_xfp,
                                preserve_settings=preserve_settings)
 
     nfc_seed = get_seed_value_ux(nfc=True)  # export seed via NFC (always truncated)
-    seed_words = get_seed_value_ux()
-    assert " ".join(nfc_seed) == truncate_seed_words(seed_words)
+    # main seed is back in effect (verify_ephemeral_secret_ui restores it)
+    assert " ".join(nfc_seed) == truncate_seed_words(simulator_fixed_words.split())
 
 
 @pytest.mark.parametrize("way", ["sd", "vdisk", "nfc"])
 @pytest.mark.parametrize("testnet", [True, False])
 @pytest.mark.parametrize("preserve_settings", [False, True])
-def test_ephemeral_seed_import_tapsigner(way, testnet, pick_menu_item, cap_story, enter_hex,
+def test_ephemeral_seed_import_tapsigner(way, testnet, pick_menu_item, cap_story, cap_story_until, enter_hex,
                                          need_keypress, reset_seed_words, goto_eph_seed_menu,
                                          verify_ephemeral_secret_ui, ephemeral_seed_disabled,
                                          nfc_write_text, tapsigner_encrypted_backup,
                                          preserve_settings):
     reset_seed_words()
 
-    fname, backup_key_hex, node = tapsigner_encrypted_backup(way, testnet=testnet)
+    fname, backup_key_hex, node = tapsigner_encrypted_backup(way, testnet=testnet, cached=True)
 
     goto_eph_seed_menu()
 
@@ -404,7 +482,6 @@ def test_ephemeral_seed_import_tapsigner(way, testnet, pick_menu_item, cap_story
             need_keypress("3")
             time.sleep(0.2)
             nfc_write_text(fname)
-            time.sleep(0.3)
     else:
         # virtual disk
         if "press (2) to import from Virtual Disk" not in story:
@@ -413,14 +490,12 @@ def test_ephemeral_seed_import_tapsigner(way, testnet, pick_menu_item, cap_story
             need_keypress("2")
 
     if way != "nfc":
-        time.sleep(0.1)
-        _, story = cap_story()
+        _, story = cap_story_until("Pick TAPSIGNER encrypted backup file")
         assert "Pick TAPSIGNER encrypted backup file" in story
         need_keypress("y")
         pick_menu_item(fname)
 
-    time.sleep(0.1)
-    _, story = cap_story()
+    _, story = cap_story_until("your TAPSIGNER")
     assert "your TAPSIGNER" in story
     assert "back of the card" in story
     need_keypress("y")  # yes I have backup key
@@ -429,19 +504,17 @@ def test_ephemeral_seed_import_tapsigner(way, testnet, pick_menu_item, cap_story
 
 
 @pytest.mark.parametrize("fail", ["wrong_key", "key_len", "plaintext", "garbage"])
-def test_ephemeral_seed_import_tapsigner_fail(pick_menu_item, cap_story, fail,
+def test_ephemeral_seed_import_tapsigner_fail(pick_menu_item, cap_story, cap_story_until, fail,
                                               need_keypress, reset_seed_words, enter_hex,
                                               tapsigner_encrypted_backup, goto_eph_seed_menu,
-                                              microsd_path, ephemeral_seed_disabled):
+                                              microsd_path, ephemeral_seed_disabled, random_bytes):
     reset_seed_words()
     fail_msg = "Decryption failed - wrong key?"
-    fname, backup_key_hex, node = tapsigner_encrypted_backup("sd", testnet=False)
+    fname, backup_key_hex, node = tapsigner_encrypted_backup("sd", testnet=False, cached=True)
     if fail == "plaintext":
-        with open(microsd_path(fname), "w") as f:
-            f.write(node.hwif(True) + "\n")
+        Path(microsd_path(fname)).write_text(node.hwif(True) + "\n")
     if fail == "garbage":
-        with open(microsd_path(fname), "wb") as f:
-            f.write(os.urandom(152))
+        Path(microsd_path(fname)).write_bytes(random_bytes(152))
 
     goto_eph_seed_menu()
 
@@ -452,24 +525,21 @@ def test_ephemeral_seed_import_tapsigner_fail(pick_menu_item, cap_story, fail,
     if "Press (1) to import TAPSIGNER encrypted backup file from SD Card" in story:
         need_keypress("1")
 
-    time.sleep(0.1)
-    _, story = cap_story()
+    _, story = cap_story_until("Pick TAPSIGNER encrypted backup file")
     assert "Pick TAPSIGNER encrypted backup file" in story
     need_keypress("y")
     pick_menu_item(fname)
 
-    time.sleep(0.1)
-    _, story = cap_story()
+    _, story = cap_story_until("Press OK to continue X to cancel.")
     assert "Press OK to continue X to cancel." in story
     need_keypress("y")  # yes I have backup key
     if fail == "wrong_key":
-        backup_key_hex = os.urandom(16).hex()
+        backup_key_hex = random_bytes(16).hex()
     if fail == "key_len":
-        backup_key_hex = os.urandom(15).hex()
+        backup_key_hex = random_bytes(15).hex()
         fail_msg = "'Backup Key' length != 32"
     enter_hex(backup_key_hex)
-    time.sleep(0.3)
-    title, story = cap_story()
+    title, story = cap_story_until(fail_msg)
     assert title == "FAILURE"
     assert fail_msg in story
     need_keypress("x")
@@ -488,7 +558,7 @@ def test_ephemeral_seed_import_tapsigner_fail(pick_menu_item, cap_story, fail,
         "xpub661MyMwAqRbcGBeMu9h1B222hQmc4XkXasbN4F3mDGTWRJ11UQ5orWv41FPVK7stXsS9UtR5DBTArBvcsHPiCE2E1PAdqq1UQiQTYmrEEaa"
     ),
 ])
-def test_ephemeral_seed_import_tapsigner_real(data, pick_menu_item, cap_story, microsd_path,
+def test_ephemeral_seed_import_tapsigner_real(data, pick_menu_item, cap_story, cap_story_until, microsd_path,
                                               need_keypress, reset_seed_words, enter_hex,
                                               goto_eph_seed_menu, verify_ephemeral_secret_ui,
                                               ephemeral_seed_disabled):
@@ -505,14 +575,12 @@ def test_ephemeral_seed_import_tapsigner_real(data, pick_menu_item, cap_story, m
     if "Press (1) to import TAPSIGNER encrypted backup file from SD Card" in story:
         need_keypress("1")
 
-    time.sleep(0.1)
-    _, story = cap_story()
+    _, story = cap_story_until("Pick TAPSIGNER encrypted backup file")
     assert "Pick TAPSIGNER encrypted backup file" in story
     need_keypress("y")
     pick_menu_item(fname)
 
-    time.sleep(0.1)
-    _, story = cap_story()
+    _, story = cap_story_until("Press OK to continue X to cancel.")
     assert "Press OK to continue X to cancel." in story
     need_keypress("y")  # yes I have backup key
     enter_hex(backup_key_hex)
@@ -536,21 +604,20 @@ def test_ephemeral_seed_import_xprv(way, testnet, reset_seed_words,
 
 
 def test_activate_current_tmp_secret(reset_seed_words, goto_eph_seed_menu,
-                                     ephemeral_seed_disabled, cap_story,
+                                     ephemeral_seed_disabled, cap_story_until,
                                      pick_menu_item, need_keypress,
                                      word_menu_entry):
     reset_seed_words()
     goto_eph_seed_menu()
     ephemeral_seed_disabled()
 
-    words, expected_xfp = WORDLISTS[12]
+    _, word_list, expected_xfp = WORDLISTS[12]
     pick_menu_item("Import Words")
     pick_menu_item(f"12 Words")
     time.sleep(0.1)
 
-    word_menu_entry(words.split())
-    time.sleep(0.3)
-    title, story = cap_story()
+    word_menu_entry(word_list)
+    title, story = cap_story_until("key in effect until next power down.")
     assert "key in effect until next power down." in story
     in_effect_xfp = title[1:-1]
     need_keypress("y")
@@ -560,9 +627,8 @@ def test_activate_current_tmp_secret(reset_seed_words, goto_eph_seed_menu,
     pick_menu_item(f"12 Words")
     time.sleep(0.1)
 
-    word_menu_entry(words.split())
-    time.sleep(0.3)
-    title, story = cap_story()
+    word_menu_entry(word_list)
+    title, story = cap_story_until("Ephemeral master key already in use")
     assert "Ephemeral master key already in use" in story
     already_used_xfp = title[1:-1]
     assert already_used_xfp == in_effect_xfp == expected_xfp
@@ -139,9 +139,7 @@ def test_export_core(way, dev, use_regtest, acct_num, pick_menu_item, goto_home,
         res = bitcoind_d_wallet.importdescriptors(obj)
         assert res[0]["success"]
         assert res[1]["success"]
-        core_gen = []
-        for i in range(3):
-            core_gen.append(bitcoind_d_wallet.getnewaddress())
+        core_gen = bitcoind_d_wallet.batch_([["getnewaddress"]] * 3)
 
         assert core_gen == addrs
         x = bitcoind_d_wallet.getaddressinfo(addrs[-1])
@@ -2226,11 +2226,11 @@ def test_bitcoind_MofN_tutorial(m_n, desc_type, clear_ms, goto_home, need_keypre
     bitcoind.delete_wallet_files(pattern="bitcoind--signer")
     bitcoind.delete_wallet_files(pattern="watch_only_")
     # create multiple bitcoin wallets (N-1) as one signer is CC
-    bitcoind_signers = [
-        bitcoind.create_wallet(wallet_name=f"bitcoind--signer{i}", disable_private_keys=False, blank=False,
-                               passphrase=None, avoid_reuse=False, descriptors=True)
+    bitcoind_signers = bitcoind.create_wallets_parallel([
+        dict(wallet_name=f"bitcoind--signer{i}", disable_private_keys=False, blank=False,
+             passphrase=None, avoid_reuse=False, descriptors=True)
         for i in range(N-1)
-    ]
+    ])
     for signer in bitcoind_signers:
         signer.keypoolrefill(100)
     # watch only wallet where multisig descriptor will be imported
@@ -2325,8 +2325,7 @@ def test_bitcoind_MofN_tutorial(m_n, desc_type, clear_ms, goto_home, need_keypre
         addr_type = "legacy"
     else:
         addr_type = "p2sh-segwit"
-    multi_addr = bitcoind_watch_only.getnewaddress("", addr_type)
-    dest_addr = bitcoind_watch_only.getnewaddress("", addr_type)
+    multi_addr, dest_addr = bitcoind_watch_only.batch_([["getnewaddress", "", addr_type]] * 2)
     if desc_type == "p2wsh_desc":
         assert all([addr.startswith("bcrt1q") for addr in [multi_addr, dest_addr]])
     else:
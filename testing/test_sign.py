@@ -1639,9 +1639,11 @@ def test_bitcoind_missing_foreign_utxo(bitcoind, bitcoind_d_sim_watch, microsd_p
     bob_pubkey = bob.getaddressinfo(bob_addr)["pubkey"]
     cc_addr = cc.getnewaddress()
     cc_pubkey = cc.getaddressinfo(cc_addr)["pubkey"]
-    # fund all addresses
-    for addr in (alice_addr, bob_addr, cc_addr):
-        bitcoind.supply_wallet.generatetoaddress(101, addr)
+    # fund all addresses: one coinbase each, then bury them past maturity -- single round trip
+    bitcoind.supply_wallet.batch_(
+        [["generatetoaddress", 1, addr] for addr in (alice_addr, bob_addr, cc_addr)]
+        + [["generatetoaddress", 100, dest_address]]
+    )
     psbt_list = []
     for w in (alice, bob, cc):
         assert w.listunspent()